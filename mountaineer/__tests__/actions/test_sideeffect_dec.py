@@ -1,8 +1,10 @@
+import gc
 from contextlib import asynccontextmanager
 from pathlib import Path
 from time import monotonic_ns
 from typing import Any
 from unittest.mock import patch
+from weakref import ref
 
 import pytest
 from fastapi import Depends, Request
@@ -282,6 +284,56 @@ async def test_get_render_parameters(
         assert resolved_dependencies == expected_resolved
 
 
+@pytest.mark.asyncio
+async def test_get_render_parameters_caches_dependant():
+    """
+    The render() dependency graph only needs to be sniffed once per controller,
+    subsequent sideeffect calls should re-use it.
+
+    """
+    from mountaineer.actions import sideeffect_dec
+    from mountaineer.actions.sideeffect_dec import get_render_parameters
+
+    class TestController(ControllerBase):
+        url: str = "/test/{path_param}/"
+        view_path = "/test.tsx"
+
+        def render(self, path_param: int) -> ExampleRenderModel:
+            return ExampleRenderModel(value_a="Hello", value_b="World")
+
+    app = AppController(view_root=Path())
+    controller = TestController()
+    app.register(controller)
+
+    fake_request = Request(
+        {
+            "type": "http",
+            "headers": Headers({"referer": "http://example.com/test/5/"}).raw,
+            "http_version": "1.1",
+            "scheme": "",
+            "client": "",
+            "server": "",
+            "method": "POST",
+        }
+    )
+
+    with patch.object(
+        sideeffect_dec, "get_dependant", wraps=sideeffect_dec.get_dependant
+    ) as mock_get_dependant:
+        for _ in range(2):
+            async with get_render_parameters(controller, fake_request) as values:
+                assert values == {"path_param": 5}
+
+    assert mock_get_dependant.call_count == 1
+
+    # The cached dependant lives on the controller definition, so dropping the app
+    # should release the controller rather than pinning it in a module-level cache
+    controller_ref = ref(controller)
+    del app, controller, mock_get_dependant
+    gc.collect()
+    assert controller_ref() is None
+
+
 @pytest.mark.parametrize(
     "use_experimental,min_time,max_time",
     [
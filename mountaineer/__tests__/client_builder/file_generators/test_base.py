@@ -1,8 +1,13 @@
+from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
-from mountaineer.client_builder.file_generators.base import CodeBlock
+from mountaineer.client_builder.file_generators.base import (
+    CodeBlock,
+    FileGeneratorBase,
+)
 
 
 class TestCodeBlock:
@@ -29,6 +34,7 @@ class TestCodeBlock:
                 "\tfirst\n\t\t\tsecond\n\t\t\t\tthird",
             ),
             # Cases with trailing newlines
+            ("    first\n", "    first\n"),
             ("    first\n        second\n", "    first\n            second\n"),
             # Cases with empty lines
             ("    first\n\n        third", "    first\n\n            third"),
@@ -98,3 +104,35 @@ class TestCodeBlock:
         input_str = "    🐍 = 'python'\n        © = 'copyright'"
         expected = "    🐍 = 'python'\n            © = 'copyright'"
         assert CodeBlock.indent(input_str) == expected
+
+
+class ExampleGenerator(FileGeneratorBase):
+    def __init__(self, *, managed_path: Path, value: str):
+        super().__init__(managed_path=managed_path)
+        self.value = value
+
+    def script(self):
+        yield CodeBlock(f"export const value = '{self.value}';")
+
+
+class TestFileGeneratorBase:
+    def test_build_skips_unchanged_content(self, tmp_path: Path):
+        managed_path = tmp_path / "example.ts"
+        ExampleGenerator(managed_path=managed_path, value="first").build()
+        assert "export const value = 'first';" in managed_path.read_text()
+
+        with patch.object(Path, "write_bytes", autospec=True) as mock_write:
+            ExampleGenerator(managed_path=managed_path, value="first").build()
+        mock_write.assert_not_called()
+
+        ExampleGenerator(managed_path=managed_path, value="second").build()
+        assert "export const value = 'second';" in managed_path.read_text()
+
+    def test_build_overwrites_undecodable_content(self, tmp_path: Path):
+        managed_path = tmp_path / "example.ts"
+        managed_path.write_bytes(b"\xff\xfe invalid utf-8")
+
+        ExampleGenerator(managed_path=managed_path, value="café").build()
+        assert "export const value = 'café';" in managed_path.read_text(
+            encoding="utf-8"
+        )
@@ -1,4 +1,5 @@
 from enum import Enum
+from graphlib import CycleError
 from pathlib import Path
 from typing import List, Sequence
 
@@ -11,6 +12,7 @@ from mountaineer.client_builder.file_generators.base import ParsedController
 from mountaineer.client_builder.file_generators.globals import (
     GlobalControllerGenerator,
     GlobalLinkGenerator,
+    sort_by_dependencies,
 )
 from mountaineer.client_builder.parser import (
     ControllerParser,
@@ -232,3 +234,27 @@ class TestGlobalLinkGenerator:
         assert "const linkGenerator = {" in content
         assert "childController: ChildControllerGetLinks" in content
         assert "export default linkGenerator" in content
+
+
+class TestSortByDependencies:
+    def test_dependency_order(self) -> None:
+        graph = {"a": ["b", "c"], "b": ["c"], "c": [], "d": []}
+        sorted_nodes = sort_by_dependencies(list(graph), lambda node: graph[node])
+
+        assert sorted(sorted_nodes) == ["a", "b", "c", "d"]
+        assert (
+            sorted_nodes.index("c") < sorted_nodes.index("b") < sorted_nodes.index("a")
+        )
+
+    def test_cycle(self) -> None:
+        graph = {"a": ["b"], "b": ["a"], "c": []}
+
+        with pytest.raises(CycleError):
+            sort_by_dependencies(list(graph), lambda node: graph[node])
+
+    def test_missing_dependency(self) -> None:
+        """Dependencies that weren't passed in can never be emitted first"""
+        graph = {"a": ["missing"], "b": []}
+
+        with pytest.raises(CycleError):
+            sort_by_dependencies(list(graph), lambda node: graph[node])
@@ -419,6 +419,24 @@ class TestControllerWrapperFeatures:
         controller_types = {c.controller for c in controllers}
         assert controller_types == {ExampleController, BaseExampleController}
 
+    def test_embedded_traversal_cached(self, parser: ControllerParser):
+        wrapper = parser.parse_controller(ExampleController)
+
+        # Repeated single-controller traversals should return the memoized results
+        assert ControllerWrapper.get_all_embedded_controllers(
+            [wrapper]
+        ) is ControllerWrapper.get_all_embedded_controllers([wrapper])
+        assert ControllerWrapper.get_all_embedded_types(
+            [wrapper], include_superclasses=True
+        ) is ControllerWrapper.get_all_embedded_types(
+            [wrapper], include_superclasses=True
+        )
+        assert ControllerWrapper.get_all_embedded_types(
+            [wrapper], include_superclasses=False
+        ) is not ControllerWrapper.get_all_embedded_types(
+            [wrapper], include_superclasses=True
+        )
+
 
 class TestIsolatedModelCreation:
     @pytest.fixture
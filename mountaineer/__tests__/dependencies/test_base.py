@@ -1,11 +1,14 @@
 from inspect import signature
+from unittest.mock import patch
 
 import pytest
 from fastapi import Depends, Request
+from fastapi.dependencies.utils import get_dependant
 from typing_extensions import Callable
 
 from mountaineer.dependencies.base import (
     DependenciesBase,
+    dependant_has_parameters,
     get_function_dependencies,
     isolate_dependency_only_function,
 )
@@ -76,6 +79,68 @@ async def test_dependency_overrides():
         assert result == "Final Value: Mocked Value"
 
 
+@pytest.mark.asyncio
+async def test_get_function_dependencies_no_parameters():
+    """
+    Functions without injected parameters shouldn't go through the solver.
+
+    """
+
+    def no_dependencies():
+        return 1
+
+    with patch("mountaineer.dependencies.base.solve_dependencies") as mock_solve:
+        async with get_function_dependencies(callable=no_dependencies) as values:
+            assert values == {}
+
+    mock_solve.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_function_dependencies_path_parameters():
+    """
+    Path parameters are validated directly against the matched request, since
+    they don't need the full solver.
+
+    """
+
+    def path_dependencies(item_id: int):
+        return item_id
+
+    request = Request(
+        scope={
+            "type": "http",
+            "path": "/items/5",
+            "path_params": {"item_id": "5"},
+            "query_string": "",
+            "headers": [],
+        }
+    )
+
+    with patch("mountaineer.dependencies.base.solve_dependencies") as mock_solve:
+        async with get_function_dependencies(
+            callable=path_dependencies, url="/items/{item_id}", request=request
+        ) as values:
+            assert values == {"item_id": 5}
+
+    mock_solve.assert_not_called()
+
+
+def test_dependant_has_parameters():
+    def no_parameters():
+        pass
+
+    def query_parameter(value: int):
+        pass
+
+    def request_parameter(request: Request):
+        pass
+
+    assert not dependant_has_parameters(get_dependant(call=no_parameters, path="/"))
+    assert dependant_has_parameters(get_dependant(call=query_parameter, path="/"))
+    assert dependant_has_parameters(get_dependant(call=request_parameter, path="/"))
+
+
 class ExamplePayload:
     value: int
 
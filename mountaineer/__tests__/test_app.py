@@ -72,6 +72,54 @@ def test_validates_layouts_exclude_urls():
         app_controller.register(TestLayoutController())
 
 
+def test_collect_layouts_probes_directories_once(tmp_path: Path):
+    """
+    Controllers that share parent directories should only check each directory for a
+    layout file once.
+
+    """
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "layout.tsx").write_text("")
+    for page in ["first", "second"]:
+        (tmp_path / "app" / page).mkdir()
+        (tmp_path / "app" / page / "page.tsx").write_text("")
+
+    class FirstController(ControllerBase):
+        url = "/first"
+        view_path = "/app/first/page.tsx"
+
+        def render(self) -> None:
+            return None
+
+    class SecondController(ControllerBase):
+        url = "/second"
+        view_path = "/app/second/page.tsx"
+
+        def render(self) -> None:
+            return None
+
+    app = AppController(view_root=tmp_path)
+
+    with patch.object(Path, "exists", autospec=True, side_effect=Path.exists) as exists:
+        app.register(FirstController())
+        app.register(SecondController())
+
+    root_layout = (tmp_path / "app" / "layout.tsx").resolve()
+    layout_probes = [
+        call for call in exists.call_args_list if call.args[0].name == "layout.tsx"
+    ]
+    assert [Path(call.args[0]).resolve() for call in layout_probes].count(
+        root_layout
+    ) == 1
+
+    # Both controllers should still be nested under the shared layout
+    layout_definition = app.path_to_layout[str(root_layout)]
+    assert {child.controller.__class__ for child in layout_definition.children} == {
+        FirstController,
+        SecondController,
+    }
+
+
 def test_format_exception_model():
     class ExampleException(APIException):
         status_code = 401
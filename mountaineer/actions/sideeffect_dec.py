@@ -15,6 +15,8 @@ from typing import (
 from urllib.parse import urlparse
 
 from fastapi import Request
+from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.utils import get_dependant
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from starlette.routing import Match
@@ -222,15 +224,15 @@ def sideeffect(*args, **kwargs):  # type: ignore
             # We need to modify this to conform to the request parameters that are sniffed
             # when the component is mounted
             # https://github.com/tiangolo/fastapi/blob/a235d93002b925b0d2d7aa650b7ab6d7bb4b24dd/fastapi/dependencies/utils.py#L250
-            sig = signature(inner)
-            parameters = list(sig.parameters.values())
-            if "request" not in sig.parameters:
+            # @wraps points inner at func, so we can re-use the signature we already sniffed
+            # instead of having inspect unwrap it again
+            parameters = list(original_sig.parameters.values())
+            if not function_needs_request:
                 request_param = Parameter(
                     "request", Parameter.POSITIONAL_OR_KEYWORD, annotation=Request
                 )
                 parameters.insert(1, request_param)  # Insert after 'self'
-            new_sig = sig.replace(parameters=parameters)
-            inner.__wrapped__.__signature__ = new_sig  # type: ignore
+            inner.__signature__ = original_sig.replace(parameters=parameters)  # type: ignore
 
             metadata = init_function_metadata(inner, FunctionActionType.SIDEEFFECT)
             metadata.reload_states = reload
@@ -274,22 +276,23 @@ async def get_render_parameters(
     # The referrer should capture the page that they're actually on
     referer = request.headers.get("referer")
     parsed_path = urlparse(referer or controller.url)
-    view_request = Request(
-        {
-            "type": request.scope["type"],
-            "path": parsed_path.path,
-            "query_string": parsed_path.query,
-            "headers": request.headers.raw,
-            "http_version": request.scope["http_version"],
-            "method": "GET",
-            "scheme": request.scope["scheme"],
-            "client": request.scope["client"],
-            "server": request.scope["server"],
-        }
-    )
+    view_scope: dict[str, Any] = {
+        "type": request.scope["type"],
+        "path": parsed_path.path,
+        "query_string": parsed_path.query,
+        "headers": request.scope["headers"],
+        "http_version": request.scope["http_version"],
+        "method": "GET",
+        "scheme": request.scope["scheme"],
+        "client": request.scope["client"],
+        "server": request.scope["server"],
+        # Make sure we're populating the path params with some values
+        # even if they're not extracted in either the view or the child definition
+        "path_params": {},
+    }
 
     if (session := request.scope.get("session", None)) is not None:
-        view_request.scope["session"] = session
+        view_scope["session"] = session
 
     if not controller._definition:
         raise RuntimeError(
@@ -302,37 +305,51 @@ async def get_render_parameters(
     # we already know which route should be resolved so we can shortcut having to
     # match non-relevant paths.
     # https://github.com/encode/starlette/blob/5c43dde0ec0917673bb280bcd7ab0c37b78061b7/starlette/routing.py#L544
-    for route in (
-        controller._definition.route.render_router.routes
+    route = (
+        controller._definition.route.render_route
         if controller._definition.route
-        and controller._definition.route.render_router is not None
-        else []
-    ):
-        match, child_scope = route.matches(view_request.scope)
+        else None
+    )
+    if route is not None:
+        match, child_scope = route.matches(view_scope)
         if match != Match.FULL:
-            raise RuntimeError(
-                f"Route {route} did not match ({match}) {view_request.scope}"
-            )
-        view_request.scope = {
-            # Make sure we're populating the path params with some values
-            # even if they're not extracted in either the view or the child definition
-            "path_params": {},
-            **view_request.scope,
-            **child_scope,
-        }
+            raise RuntimeError(f"Route {route} did not match ({match}) {view_scope}")
+        # The scope is private to this call, so we can merge the route matches in place
+        view_scope.update(child_scope)
+
+    view_request = Request(view_scope)
+
+    render_url = (
+        controller.url if not isinstance(controller, LayoutControllerBase) else None
+    )
 
     try:
         async with get_function_dependencies(
             callable=controller.render,
-            url=(
-                controller.url
-                if not isinstance(controller, LayoutControllerBase)
-                else None
-            ),
+            url=render_url,
             request=view_request,
+            dependant=get_render_dependant(controller, render_url),
         ) as values:
             yield values
     except RuntimeError as e:
         raise RuntimeError(
             f"Error occurred while resolving dependencies for render(): {controller}: {e}"
         ) from e
+
+
+def get_render_dependant(controller: "ControllerBase", url: str | None) -> Dependant:
+    """
+    Resolve the FastAPI dependant for the controller's render() function. The render()
+    signature is fixed once the controller is mounted, so we sniff it once and keep it
+    on the controller's route. It's released along with the rest of the definition when
+    the controller is swapped out.
+
+    """
+    route = controller._definition.route if controller._definition else None
+    if route is not None and route.render_dependant is not None:
+        return route.render_dependant
+
+    dependant = get_dependant(call=controller.render, path=url or "/synthetic")
+    if route is not None:
+        route.render_dependant = dependant
+    return dependant
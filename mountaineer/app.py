@@ -187,6 +187,10 @@ class AppController:
 
         self.path_to_layout: dict[str, ControllerDefinition] = {}
 
+        # Controllers that live in the same view tree share most of their parent
+        # directories, so we only need to check each one for a layout file once
+        self._directory_layouts: dict[Path, ManagedViewPath | None] = {}
+
         self.live_reload_port: int = 0
 
     def _validate_view(self, view_root: ManagedViewPath):
@@ -482,6 +486,7 @@ class AppController:
             view_route=generate_controller_html,
             url_prefix=controller_url_prefix,
             render_router=view_router,
+            render_route=view_router.routes[0] if view_router else None,
         )
 
         return controller_definition
@@ -743,8 +748,14 @@ class AppController:
                     f"View path ({full_view_path}) is not within the package root: {package_root}"
                 )
 
-            layout_file = current_path / "layout.tsx"
-            if layout_file.exists():
+            if current_path not in self._directory_layouts:
+                candidate_layout = current_path / "layout.tsx"
+                self._directory_layouts[current_path] = (
+                    candidate_layout if candidate_layout.exists() else None
+                )
+
+            layout_file = self._directory_layouts[current_path]
+            if layout_file is not None:
                 # Never create a self-referential layout
                 # This can happen with layout controllers that will also find their
                 # own layout.tsx file
@@ -816,6 +827,9 @@ class AppController:
         target_controller.route.render_router.get(target_controller.controller.url)(
             target_controller.route.view_route
         )
+        target_controller.route.render_route = (
+            target_controller.route.render_router.routes[-1]
+        )
 
         self.app.include_router(target_controller.route.render_router)
 
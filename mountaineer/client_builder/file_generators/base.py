@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib.metadata import version
+from itertools import chain
 from pathlib import Path
 from typing import Generator
 
@@ -21,18 +23,26 @@ class ParsedController:
 class FileGeneratorBase(ABC):
     def __init__(self, *, managed_path: Path):
         self.managed_path = managed_path
-
-        mountaineer_version = version("mountaineer")
-        self.standard_header = CodeBlock(
-            "/*",
-            f" * This file was generated by Mountaineer v{mountaineer_version}. Do not edit it manually.",
-            " */",
-        )
+        self.standard_header = get_standard_header()
 
     def build(self):
-        blocks = list(self.script())
-        blocks = [self.standard_header] + blocks
-        self.managed_path.write_text("\n\n".join(block.content for block in blocks))
+        # Render straight off the script() generator instead of collecting the blocks
+        # into intermediate lists just to prepend the header. A list comprehension
+        # lets join() size the output in one go.
+        blocks = chain((self.standard_header,), self.script())
+        content = "\n\n".join([block.content for block in blocks]).encode("utf-8")
+
+        # Leave unchanged files alone so their mtimes stay put, otherwise every rebuild
+        # would look like an edit to the file watchers and bundlers downstream. Comparing
+        # bytes means we never have to decode whatever is already on disk; anything we
+        # can't read is simply overwritten like before.
+        try:
+            if self.managed_path.read_bytes() == content:
+                return
+        except OSError:
+            pass
+
+        self.managed_path.write_bytes(content)
 
     @abstractmethod
     def script(self) -> Generator["CodeBlock", None, None]:
@@ -46,6 +56,9 @@ class CodeBlock:
 
     """
 
+    # Generators emit many small blocks per build, so skip the per-instance __dict__
+    __slots__ = ("lines",)
+
     def __init__(self, *lines: str):
         self.lines = lines
 
@@ -63,24 +76,26 @@ class CodeBlock:
         if not line or "\n" not in line:
             return line
 
-        has_trailing_newline = line.endswith("\n")
-        lines = line[:-1].split("\n") if has_trailing_newline else line.split("\n")
+        first_line, _, remainder = line.partition("\n")
 
-        # Get the base indentation from first line
-        base_indent, _ = cls._get_indent_level(lines[0])
+        # A lone trailing newline has no subsequent lines to re-indent
+        if not remainder:
+            return line
 
-        # Process all lines
-        result: list[str] = []
-        result.append(lines[0])  # First line remains unchanged
+        # Get the base indentation from first line. Without one there's nothing
+        # to add to the subsequent lines.
+        base_indent, _ = cls._get_indent_level(first_line)
+        if not base_indent:
+            return line
 
-        # Add base indentation to subsequent lines while preserving their own
-        for current_line in lines[1:]:
-            if current_line.strip():  # If line has content
-                result.append(base_indent + current_line)
-            else:  # Preserve empty or whitespace-only lines as-is
-                result.append(current_line)
+        # Add base indentation to subsequent lines while preserving their own. Empty or
+        # whitespace-only lines are kept as-is, which also leaves a trailing newline intact.
+        indented = [
+            base_indent + current_line if current_line.strip() else current_line
+            for current_line in remainder.split("\n")
+        ]
 
-        return "\n".join(result) + ("\n" if has_trailing_newline else "")
+        return first_line + "\n" + "\n".join(indented)
 
     @classmethod
     def _get_indent_level(cls, line: str) -> tuple[str, int]:
@@ -88,13 +103,25 @@ class CodeBlock:
         Get the indentation string and count from the start of a line.
         Returns tuple of (indent_str, indent_count).
         """
-        indent_str = ""
-        for char in line:
-            if char not in (" ", "\t"):
-                break
-            indent_str += char
-        return indent_str, len(indent_str)
+        indent_count = len(line) - len(line.lstrip(" \t"))
+        return line[:indent_count], indent_count
 
     @property
     def content(self):
         return "\n".join(self.lines)
+
+
+@lru_cache(maxsize=1)
+def get_standard_header() -> CodeBlock:
+    """
+    Every generated file shares the same header. The installed version can't change
+    while we're running, so look up the package metadata once and share the block
+    across all file generators.
+
+    """
+    mountaineer_version = version("mountaineer")
+    return CodeBlock(
+        "/*",
+        f" * This file was generated by Mountaineer v{mountaineer_version}. Do not edit it manually.",
+        " */",
+    )
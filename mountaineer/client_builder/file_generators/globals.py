@@ -1,5 +1,6 @@
-from graphlib import TopologicalSorter
-from typing import Any
+from collections import defaultdict, deque
+from graphlib import CycleError
+from typing import Any, Callable, Iterable, TypeVar
 
 from inflection import camelize
 
@@ -23,6 +24,14 @@ from mountaineer.client_builder.typescript import (
 )
 from mountaineer.paths import ManagedViewPath, generate_relative_import
 
+T = TypeVar("T")
+
+# Section headers are identical for every build, and CodeBlocks are immutable, so
+# they can be shared instead of rebuilt each time
+MODELS_HEADER = CodeBlock("/*", " * Models + Enums", " */")
+EXCEPTIONS_HEADER = CodeBlock("/*", " * Exceptions", " */")
+CONTROLLERS_HEADER = CodeBlock("/*", " * View Controllers", " */")
+
 
 class GlobalControllerGenerator(FileGeneratorBase):
     """
@@ -59,11 +68,7 @@ class GlobalControllerGenerator(FileGeneratorBase):
             embedded_types.models, embedded_types.enums
         )
 
-        yield CodeBlock(
-            "/*",
-            " * Models + Enums",
-            " */",
-        )
+        yield MODELS_HEADER
 
         # Models and enums will be used by the action signatures contained
         # in the controllers
@@ -75,21 +80,13 @@ class GlobalControllerGenerator(FileGeneratorBase):
             else:
                 raise ValueError(f"Unsupported item type: {item}")
 
-        yield CodeBlock(
-            "/*",
-            " * Exceptions",
-            " */",
-        )
+        yield EXCEPTIONS_HEADER
 
         # Exceptions don't have other dependencies so they can be added in any order
         for exception in embedded_types.exceptions:
             yield CodeBlock(ExceptionInterface.from_exception(exception).to_js())
 
-        yield CodeBlock(
-            "/*",
-            " * View Controllers",
-            " */",
-        )
+        yield CONTROLLERS_HEADER
 
         # Then process controllers in dependency order
         for controller in controller_sorted:
@@ -97,56 +94,27 @@ class GlobalControllerGenerator(FileGeneratorBase):
 
     def _build_model_enum_graph(
         self, models: list[ModelWrapper], enums: list[EnumWrapper]
-    ):
+    ) -> list[ModelWrapper | EnumWrapper]:
         """Build dependency graph for models and enums"""
-        # Build id-based graph
-        graph: dict[int, set[int]] = {}
-        id_to_obj: dict[int, ModelWrapper | EnumWrapper] = {}
-
-        # Initialize graph entries for all models and enums
-        for model in models:
-            graph[id(model)] = set()
-            id_to_obj[id(model)] = model
-
-        for enum in enums:
-            graph[id(enum)] = set()
-            id_to_obj[id(enum)] = enum
 
-        # Add model superclass dependencies
-        for model in models:
-            graph[id(model)].update(id(superclass) for superclass in model.superclasses)
-
-            # Add field dependencies
-            for field in model.value_models:
+        def get_dependencies(item: ModelWrapper | EnumWrapper):
+            if isinstance(item, EnumWrapper):
+                return
+            # Superclasses and field types have to be defined before the model itself
+            yield from item.superclasses
+            for field in item.value_models:
                 if isinstance(field.value, (ModelWrapper, EnumWrapper)):
-                    graph[id(model)].add(id(field.value))
+                    yield field.value
 
-        # Convert graph to use actual objects for TopologicalSorter
-        sorted_ids = TopologicalSorter(graph).static_order()
-        return [id_to_obj[node_id] for node_id in sorted_ids]
+        return sort_by_dependencies([*models, *enums], get_dependencies)
 
     def _build_controller_graph(
         self, controllers: list[ControllerWrapper]
     ) -> list[ControllerWrapper]:
         """Build dependency graph for controllers"""
-        # Build id-based graph
-        graph: dict[int, set[int]] = {}
-        id_to_obj: dict[int, ControllerWrapper] = {}
-
-        # Initialize graph entries for all controllers
-        for controller in controllers:
-            graph[id(controller)] = set()
-            id_to_obj[id(controller)] = controller
-
-        # Add controller superclass dependencies
-        for controller in controllers:
-            graph[id(controller)].update(
-                id(superclass) for superclass in controller.superclasses
-            )
-
-        # Convert graph to use actual objects for TopologicalSorter
-        sorted_ids = TopologicalSorter(graph).static_order()
-        return [id_to_obj[node_id] for node_id in sorted_ids]
+        return sort_by_dependencies(
+            controllers, lambda controller: controller.superclasses
+        )
 
 
 class GlobalLinkGenerator(FileGeneratorBase):
@@ -168,7 +136,11 @@ class GlobalLinkGenerator(FileGeneratorBase):
             if parsed_controller.is_layout:
                 continue
 
-            controller_dir = parsed_controller.view_path.get_managed_code_dir()
+            # We only need the location to compute the relative import. The local
+            # generators create the directory when they write the links.ts file itself.
+            controller_dir = parsed_controller.view_path.get_managed_code_dir(
+                create_dir=False
+            )
             controller_implementation_path = generate_relative_import(
                 self.managed_path, controller_dir / "links.ts"
             )
@@ -193,3 +165,44 @@ class GlobalLinkGenerator(FileGeneratorBase):
         yield CodeBlock(*imports)
         yield CodeBlock(f"const linkGenerator = {link_generator};")
         yield CodeBlock("export default linkGenerator;")
+
+
+def sort_by_dependencies(
+    nodes: list[T], get_dependencies: Callable[[T], Iterable[T]]
+) -> list[T]:
+    """
+    Order nodes so that each one comes after all of its dependencies. This is Kahn's
+    algorithm over a reverse adjacency list, so we visit every node and edge once
+    instead of building a separate graph for TopologicalSorter to walk again.
+
+    Nodes are keyed by identity, since our wrappers aren't hashable by value.
+
+    """
+    id_to_obj = {id(node): node for node in nodes}
+    in_degree = dict.fromkeys(id_to_obj, 0)
+    dependents: defaultdict[int, list[int]] = defaultdict(list)
+
+    for node_id, node in id_to_obj.items():
+        for dependency in get_dependencies(node):
+            dependents[id(dependency)].append(node_id)
+            in_degree[node_id] += 1
+
+    queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+    sorted_nodes: list[T] = []
+    while queue:
+        node_id = queue.popleft()
+        sorted_nodes.append(id_to_obj[node_id])
+        for dependent_id in dependents.get(node_id, []):
+            in_degree[dependent_id] -= 1
+            if in_degree[dependent_id] == 0:
+                queue.append(dependent_id)
+
+    # Anything left over is either part of a cycle or depends on a node that
+    # wasn't provided, neither of which can be written out in order
+    if len(sorted_nodes) != len(id_to_obj):
+        unresolved = [
+            id_to_obj[node_id] for node_id, degree in in_degree.items() if degree > 0
+        ]
+        raise CycleError("Unable to resolve dependency order", unresolved)
+
+    return sorted_nodes
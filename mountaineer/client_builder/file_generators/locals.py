@@ -428,7 +428,7 @@ class LocalIndexGenerator(LocalGeneratorBase):
         exports = []
         for module in ["actions", "links", "models", "useServer"]:
             module_file = self.managed_path.parent / f"{module}.ts"
-            if module_file.exists() and module_file.read_text().strip():
+            if module_file.exists() and module_file.read_text(encoding="utf-8").strip():
                 exports.append(f"export * from './{module}';")
 
         yield CodeBlock(*exports)
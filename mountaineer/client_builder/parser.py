@@ -1,5 +1,5 @@
 from copy import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
 from enum import Enum
 from inspect import isclass
 from typing import (
@@ -135,6 +135,16 @@ class ControllerWrapper(CoreWrapper):
         str, ActionWrapper
     ]  # {url: action} directly implemented for this controller
 
+    # The builder walks each controller's embedded definitions several times per build
+    # (aliasing, local models, local exceptions). Wrappers are immutable once parsed,
+    # so we memoize single-controller traversals on the wrapper itself.
+    _embedded_controllers: list["ControllerWrapper"] | None = dataclass_field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _embedded_types: dict[bool, "EmbeddedTypeContainer"] = dataclass_field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     @property
     def all_actions(self) -> list[ActionWrapper]:
         # Convert each action. We also include the superclass methods, since they're
@@ -171,6 +181,11 @@ class ControllerWrapper(CoreWrapper):
         referenced by superclasses.
 
         """
+        if len(controllers) == 1:
+            cached_types = controllers[0]._embedded_types.get(include_superclasses)
+            if cached_types is not None:
+                return cached_types
+
         models: list[ModelWrapper] = []
         enums: list[EnumWrapper] = []
         exceptions: list[ExceptionWrapper] = []
@@ -223,7 +238,12 @@ class ControllerWrapper(CoreWrapper):
                 yield from item.children
 
         cls._traverse_iterator(_traverse_logic, controllers)
-        return EmbeddedTypeContainer(models=models, enums=enums, exceptions=exceptions)
+        embedded_types = EmbeddedTypeContainer(
+            models=models, enums=enums, exceptions=exceptions
+        )
+        if len(controllers) == 1:
+            controllers[0]._embedded_types[include_superclasses] = embedded_types
+        return embedded_types
 
     @classmethod
     def get_all_embedded_controllers(
@@ -233,6 +253,9 @@ class ControllerWrapper(CoreWrapper):
         Gets all unique superclasses of the given set of controllers.
 
         """
+        if len(controllers) == 1 and controllers[0]._embedded_controllers is not None:
+            return controllers[0]._embedded_controllers
+
         all_controllers: list[ControllerWrapper] = []
 
         def _traverse_logic(item: ControllerWrapper):
@@ -242,6 +265,8 @@ class ControllerWrapper(CoreWrapper):
             yield from item.superclasses
 
         cls._traverse_iterator(_traverse_logic, controllers)
+        if len(controllers) == 1:
+            controllers[0]._embedded_controllers = all_controllers
         return all_controllers
 
     @classmethod
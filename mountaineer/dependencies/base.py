@@ -5,7 +5,12 @@ from inspect import signature
 from typing import Any, Callable
 
 from fastapi import Request, params as fastapi_params
-from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.utils import (
+    get_dependant,
+    request_params_to_args,
+    solve_dependencies,
+)
 
 
 class DependenciesBaseMeta(type):
@@ -62,6 +67,7 @@ async def get_function_dependencies(
     url: str | None = None,
     request: Request | None = None,
     dependency_overrides: dict[Callable, Callable] | None = None,
+    dependant: Dependant | None = None,
 ):
     """
     Get the dependencies of a function. This will return the values that should
@@ -72,6 +78,10 @@ async def get_function_dependencies(
     the dependency chains. This is useful during testing or when you need to override one value
     in a dependency pipeline (like a user session) with a deterministic value.
 
+    :param dependant: Pre-computed FastAPI dependant for `callable`. Callers that resolve
+    the same function many times can cache this to avoid re-inspecting its signature on
+    every call.
+
     """
     # Synthesize defaults
     if not url:
@@ -88,10 +98,30 @@ async def get_function_dependencies(
         )
 
     # Synthetic request object as if we're coming from the original first page
-    dependant = get_dependant(
-        call=callable,
-        path=url,
-    )
+    if dependant is None:
+        dependant = get_dependant(
+            call=callable,
+            path=url,
+        )
+
+    # Functions without any injected parameters (common for simple render() functions)
+    # have nothing to resolve, so we can skip the exit stack and the solver entirely
+    if not dependant_has_parameters(dependant):
+        yield {}
+        return
+
+    # Path parameters have already been split out by the router match, so when they're
+    # the only inputs we can validate them directly without walking the dependency graph
+    if not dependant_has_non_path_parameters(dependant):
+        values, errors = request_params_to_args(
+            dependant.path_params, request.path_params
+        )
+        if errors:
+            raise RuntimeError(
+                f"Errors encountered while resolving dependencies: {errors}"
+            )
+        yield values
+        return
 
     async with AsyncExitStack() as async_exit_stack:
         payload = await solve_dependencies(
@@ -117,6 +147,36 @@ async def get_function_dependencies(
         yield payload.values
 
 
+def dependant_has_parameters(dependant: Dependant) -> bool:
+    """
+    Determine whether FastAPI would need to inject any values when calling
+    this dependant, either from the request or from sub-dependencies.
+
+    """
+    return bool(dependant.path_params) or dependant_has_non_path_parameters(dependant)
+
+
+def dependant_has_non_path_parameters(dependant: Dependant) -> bool:
+    """
+    Determine whether the dependant needs anything beyond the path parameters that
+    the router has already extracted. If not, we can skip the full dependency solver.
+
+    """
+    return bool(
+        dependant.query_params
+        or dependant.header_params
+        or dependant.cookie_params
+        or dependant.body_params
+        or dependant.dependencies
+        or dependant.request_param_name
+        or dependant.websocket_param_name
+        or dependant.http_connection_param_name
+        or dependant.response_param_name
+        or dependant.background_tasks_param_name
+        or dependant.security_scopes_param_name
+    )
+
+
 def isolate_dependency_only_function(original_fn: Callable):
     """
     Create and return a mocked function that only includes the Depends parameters
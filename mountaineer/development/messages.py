@@ -5,14 +5,14 @@ from typing import Generic, TypeVar
 TResponse = TypeVar("TResponse")
 
 
-@dataclass
+@dataclass(slots=True)
 class IsolatedMessageBase(Generic[TResponse]):
     """Base class for all messages passed between main process and isolated app context"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorResponse:
     """Generic error response"""
 
@@ -20,21 +20,21 @@ class ErrorResponse:
     traceback: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessResponse:
     """Generic success response"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BootupMessage(IsolatedMessageBase[SuccessResponse | ErrorResponse]):
     """Message to bootup the isolated app context"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StartServerMessage(IsolatedMessageBase[SuccessResponse | ErrorResponse]):
     """Message to start the server"""
 
@@ -43,14 +43,14 @@ class StartServerMessage(IsolatedMessageBase[SuccessResponse | ErrorResponse]):
     live_reload_port: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildJsMessage(IsolatedMessageBase[SuccessResponse | ErrorResponse]):
     """Message to trigger JS compilation"""
 
     updated_js: list[Path] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildUseServerMessage(IsolatedMessageBase[SuccessResponse | ErrorResponse]):
     """Message to build the useServer support files"""
 
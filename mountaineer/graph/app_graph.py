@@ -3,6 +3,8 @@ from inspect import Parameter, signature
 from typing import Callable, Type
 
 from fastapi import APIRouter
+from fastapi.dependencies.models import Dependant
+from starlette.routing import BaseRoute
 
 from mountaineer.actions.fields import FunctionMetadata
 from mountaineer.controller import ControllerBase
@@ -37,6 +39,20 @@ class ControllerRoute:
 
     """
 
+    render_route: BaseRoute | None = None
+    """
+    The single view route mounted on `render_router`. Sideeffects match against it
+    on every call, so we keep a direct reference instead of walking the router.
+
+    """
+
+    render_dependant: Dependant | None = None
+    """
+    FastAPI dependency graph of the controller's render(), resolved lazily the first
+    time a sideeffect needs to re-render the page.
+
+    """
+
 
 @dataclass(kw_only=True)
 class ControllerDefinition:
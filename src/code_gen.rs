@@ -4,46 +4,57 @@
  * React component that is mounted on the page.
 */
 
+use std::fmt::Write;
+
 pub fn build_entrypoint(
     path_group: &[String],
     is_server: bool,
     live_reload_import: &str,
 ) -> String {
-    // Generate the synthetic entrypoint content
-    let mut entrypoint_content = String::from("import React from 'react';\n");
-    entrypoint_content += &format!("import mountLiveReload from '{live_reload_import}';\n\n");
+    // Generate the synthetic entrypoint content. We format directly into one buffer sized
+    // for the boilerplate plus the imports, rather than allocating a String per line.
+    // Writing into a String is infallible, so the writeln! results are safe to unwrap.
+    let paths_len: usize = path_group.iter().map(|path| path.len()).sum();
+    let mut entrypoint_content = String::with_capacity(1024 + paths_len);
+    entrypoint_content.push_str("import React from 'react';\n");
+    writeln!(
+        entrypoint_content,
+        "import mountLiveReload from '{live_reload_import}';\n"
+    )
+    .unwrap();
 
     for (j, path) in path_group.iter().enumerate() {
-        entrypoint_content += &format!("import Layout{j} from '{path}';\n");
+        writeln!(entrypoint_content, "import Layout{j} from '{path}';").unwrap();
     }
 
-    entrypoint_content += "\nconst Entrypoint = () => {\n";
-    entrypoint_content += "    mountLiveReload({SSR_RENDERING: process.env.SSR_RENDERING, NODE_ENV: process.env.NODE_ENV, LIVE_RELOAD_PORT: process.env.LIVE_RELOAD_PORT});\n";
-    entrypoint_content += "    return (\n";
+    entrypoint_content.push_str("\nconst Entrypoint = () => {\n");
+    entrypoint_content.push_str("    mountLiveReload({SSR_RENDERING: process.env.SSR_RENDERING, NODE_ENV: process.env.NODE_ENV, LIVE_RELOAD_PORT: process.env.LIVE_RELOAD_PORT});\n");
+    entrypoint_content.push_str("    return (\n");
 
-    // Nest the layouts
-    for (i, _path) in path_group.iter().enumerate() {
-        entrypoint_content += &"        ".repeat(i + 1);
-        entrypoint_content += &format!("<Layout{i}>\n");
+    // Nest the layouts. Indentation is padded by the formatter so we don't allocate
+    // a separate String for every nesting level.
+    for i in 0..path_group.len() {
+        let indent = 8 * (i + 1);
+        writeln!(entrypoint_content, "{:indent$}<Layout{i}>", "").unwrap();
     }
 
     // Close the nested layouts
-    for (i, _path) in path_group.iter().enumerate().rev() {
-        entrypoint_content += &"        ".repeat(i + 1);
-        entrypoint_content += &format!("</Layout{i}>\n");
+    for i in (0..path_group.len()).rev() {
+        let indent = 8 * (i + 1);
+        writeln!(entrypoint_content, "{:indent$}</Layout{i}>", "").unwrap();
     }
 
-    entrypoint_content += "    );\n";
-    entrypoint_content += "};\n\n";
+    entrypoint_content.push_str("    );\n");
+    entrypoint_content.push_str("};\n\n");
 
     // Add client-side or server-side specific code
     if !is_server {
-        entrypoint_content += "import { hydrateRoot } from 'react-dom/client';\n";
-        entrypoint_content += "const container = document.getElementById('root');\n";
-        entrypoint_content += "hydrateRoot(container, <Entrypoint />);\n";
+        entrypoint_content.push_str("import { hydrateRoot } from 'react-dom/client';\n");
+        entrypoint_content.push_str("const container = document.getElementById('root');\n");
+        entrypoint_content.push_str("hydrateRoot(container, <Entrypoint />);\n");
     } else {
-        entrypoint_content += "import { renderToString } from 'react-dom/server.edge';\n";
-        entrypoint_content += "export const Index = () => renderToString(<Entrypoint />);\n";
+        entrypoint_content.push_str("import { renderToString } from 'react-dom/server.edge';\n");
+        entrypoint_content.push_str("export const Index = () => renderToString(<Entrypoint />);\n");
     }
 
     entrypoint_content